@@ -2,15 +2,21 @@
 tk_info_manager.py
 
 - Dark-themed Tkinter app to manage info.json by date/subject and drag/drop or pick images.
-- Creates backups of info.json before modifying.
+- Saves edits automatically (debounced) and creates backups of info.json before modifying.
 - Copies dropped/selected images into images/<date>/ with naming scheme <subject_key><n>.<ext>.
 """
 
 import os
+import sys
 import json
 import shutil
 import datetime
+import concurrent.futures
+from collections import deque
+import hashlib
+import mmap
 import re
+import time
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -23,12 +29,26 @@ try:
 except Exception:
     TRY_TKDNDF = False
 
+# orjson is much faster at (de)serializing a large info.json; fall back to the stdlib json module.
+HAVE_ORJSON = True
+try:
+    import orjson
+except Exception:
+    HAVE_ORJSON = False
+
 # ----------------------------
 # Helpers
 # ----------------------------
 INFO_JSON = Path("info.json")
 BACKUP_DIR = Path("backups")
+BACKUP_KEEP = 10  # number of most recent backups kept in BACKUP_DIR
 IMAGES_ROOT = Path("images")
+MMAP_MIN_SIZE = 256 * 1024  # parse info.json straight from an mmap above this size
+COPY_CHUNK = 1 << 20  # 1 MiB per read/sendfile call when copying images
+COPY_WORKERS = 4  # background threads copying images
+COPY_POLL_MS = 20  # how often the UI checks for finished copies
+DROP_QUIET_MS = 75  # wait this long after the last drop event before processing drops
+FLUSH_DELAY_MS = 200  # coalesce edits made within this window into one backup + write
 
 
 def ensure_dirs():
@@ -39,17 +59,65 @@ def ensure_dirs():
 def read_json():
     if not INFO_JSON.exists():
         return []
-    with INFO_JSON.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    if HAVE_ORJSON and INFO_JSON.stat().st_size > MMAP_MIN_SIZE:
+        # orjson parses the mapped pages directly, no intermediate bytes copy
+        with INFO_JSON.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return to_internal(orjson.loads(view))
+    raw = INFO_JSON.read_bytes()
+    if HAVE_ORJSON:
+        return to_internal(orjson.loads(raw))
+    return to_internal(json.loads(raw))
+
+
+def to_internal(data):
+    """
+    On disk each day has "subjects": [{"subject": name, "images": [...]}].
+    In memory that list becomes an ordered dict {name: [images...]}.
+    """
+    for entry in data:
+        subjects = {}
+        for s in entry.get("subjects", []):
+            # a subject listed twice for one day is merged into one
+            subjects.setdefault(s.get("subject"), []).extend(s.get("images", []))
+        entry["subjects"] = subjects
+    return data
+
+
+def to_external(data):
+    # Inverse of to_internal: shallow copies in the on-disk layout.
+    return [
+        {**entry, "subjects": [{"subject": name, "images": images}
+                               for name, images in entry["subjects"].items()]}
+        for entry in data
+    ]
 
 
-def write_json(data):
-    with INFO_JSON.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def dump_json(data):
+    # Serialize to UTF-8 bytes; both encoders produce the same 2-space layout.
+    clean = to_external(data)
+    if HAVE_ORJSON:
+        return orjson.dumps(clean, option=orjson.OPT_INDENT_2)
+    return json.dumps(clean, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def payload_digest(payload):
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def write_json_bytes(payload):
+    # Write to a temp file and swap it in, so a crash never leaves a half-written info.json.
+    tmp = INFO_JSON.with_suffix(".json.tmp")
+    with tmp.open("wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, INFO_JSON)
 
 
 def backup_json():
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    # microseconds keep two backups taken within the same second apart
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     BACKUP_DIR.mkdir(exist_ok=True)
     dest = BACKUP_DIR / f"info_backup_{timestamp}.json"
     
@@ -57,15 +125,15 @@ def backup_json():
     if INFO_JSON.exists():
         shutil.copy2(INFO_JSON, dest)
 
-    # 2. Cleanup: Limit to max 4 backups
+    # 2. Cleanup: Limit to max BACKUP_KEEP backups
     # Get all .json files in the backup dir
     backups = list(BACKUP_DIR.glob("*.json"))
     
     # Sort them by modification time (Oldest -> Newest)
     backups.sort(key=lambda f: f.stat().st_mtime)
 
-    # While we have more than 4, delete the item at index 0 (the oldest)
-    while len(backups) > 4:
+    # While we have more than BACKUP_KEEP, delete the item at index 0 (the oldest)
+    while len(backups) > BACKUP_KEEP:
         oldest_file = backups.pop(0)
         try:
             oldest_file.unlink() # Deletes the file
@@ -93,63 +161,118 @@ def parse_date_str(s: str):
         return None
 
 
-def get_day_entry(data, date_str):
+def build_index(data):
+    # {date: day_entry} lookup table for data (as returned by read_json).
+    # A date listed twice maps to its first entry, as the old linear scan did.
+    by_date = {}
     for entry in data:
-        if entry.get("date") == date_str:
-            return entry
-    return None
+        by_date.setdefault(entry.get("date"), entry)
+    return by_date
 
 
-def create_day_entry(data, date_str):
-    entry = {"date": date_str, "subjects": []}
+def get_day_entry(by_date, date_str):
+    return by_date.get(date_str)
+
+
+def create_day_entry(data, by_date, date_str):
+    entry = {"date": date_str, "subjects": {}}
     data.append(entry)
+    by_date[date_str] = entry
     return entry
 
 
-def get_subject_entry(day_entry, subject_name):
-    for s in day_entry.get("subjects", []):
-        if s.get("subject") == subject_name:
-            return s
-    return None
+def get_subject_images(day_entry, subject_name):
+    # The subject's image list, or None if the day has no such subject
+    return day_entry["subjects"].get(subject_name)
 
 
-def create_subject_entry(day_entry, subject_name):
-    subj = {"subject": subject_name, "images": []}
-    day_entry.setdefault("subjects", []).append(subj)
-    return subj
+def subject_images(day_entry, subject_name):
+    # The subject's image list, creating the subject if needed
+    return day_entry["subjects"].setdefault(subject_name, [])
 
 
-def next_image_name_for(subject_key, date_folder: Path, ext):
+def used_image_numbers(subject_key, date_folder: Path, ext):
     # find files in date_folder that start with subject_key and end with ext, like chem1.jpg
-    existing = []
-    if date_folder.exists():
-        for f in date_folder.iterdir():
-            if f.is_file():
-                nm = f.name
-                if nm.lower().startswith(subject_key) and nm.lower().endswith(ext.lower()):
-                    # extract trailing number if present
-                    m = re.match(rf'^{re.escape(subject_key)}(\d+){re.escape(ext.lower())}$', nm.lower())
-                    if m:
-                        try:
-                            existing.append(int(m.group(1)))
-                        except:
-                            pass
-                    else:
-                        # name exists but without number -> consider 1 as used (reserve)
-                        existing.append(1)
-    # choose smallest positive integer not in existing
+    existing = set()
+    ext_low = ext.lower()
+    if not date_folder.exists():
+        return existing
+    # scandir entries carry the file type from the listing itself, no stat per file
+    with os.scandir(date_folder) as it:
+        for de in it:
+            if not de.is_file():
+                continue
+            nm_low = de.name.lower()
+            if not (nm_low.startswith(subject_key) and nm_low.endswith(ext_low)):
+                continue
+            # extract the number between key and extension if present
+            mid = nm_low[len(subject_key):len(nm_low) - len(ext_low)]
+            if mid.isdecimal():
+                existing.add(int(mid))
+            else:
+                # name exists but without number -> consider 1 as used (reserve)
+                existing.add(1)
+    return existing
+
+
+def next_image_name_for(subject_key, ext, used):
+    """
+    used: set from used_image_numbers(); the chosen number is added to it,
+    so one scan of the folder serves a whole batch of copies.
+    """
+    # choose smallest positive integer not in used
     n = 1
-    existing_set = set(existing)
-    while n in existing_set:
+    while n in used:
         n += 1
+    used.add(n)
     return f"{subject_key}{n}{ext}"
 
 
-def copy_images_to_folder(files, date_str, subject_name):
+def fast_copy(src, dst):
+    # Copy file contents in large chunks (sendfile on Linux), then metadata once like copy2.
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                offset = 0
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    else:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=COPY_CHUNK)
+    shutil.copystat(src, dst)
+
+
+def fsync_dir(path: Path):
+    # Flush directory entries (new files) to disk; only possible on POSIX.
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    # Best effort: some network/FUSE mounts refuse to fsync a directory.
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def plan_image_copies(files, date_str, subject_name):
     """
     files: list of filesystem paths (strings)
     date_str: DD-MM-YYYY
     subject_name: string
+    Returns [(src_path, dst_path)] with destination names already chosen;
+    the copying itself (fast_copy) is left to the caller.
     """
     ensure_dirs()
     date_folder = IMAGES_ROOT / date_str
@@ -157,18 +280,20 @@ def copy_images_to_folder(files, date_str, subject_name):
 
     subject_key = normalize_subject_key(subject_name)
 
-    copied_paths = []
+    copies = []
+    used_by_ext = {}  # ext -> used numbers, scanned once per batch
     for src in files:
         src_path = Path(src)
         if not src_path.exists():
             continue
         ext = src_path.suffix  # includes dot
-        new_name = next_image_name_for(subject_key, date_folder, ext)
+        used = used_by_ext.get(ext.lower())
+        if used is None:
+            used = used_by_ext[ext.lower()] = used_image_numbers(subject_key, date_folder, ext)
+        new_name = next_image_name_for(subject_key, ext, used)
         dst = date_folder / new_name
-        # ensure we don't overwrite (shouldn't due to naming logic, but safe)
-        shutil.copy2(src_path, dst)
-        copied_paths.append(str(dst.as_posix()))
-    return copied_paths
+        copies.append((src_path, dst))
+    return copies
 
 
 # ----------------------------
@@ -178,18 +303,34 @@ class InfoManagerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Info.json Manager")
-        self.data = []
+        self.data = None  # set by load_data once the window is up
+        self._load_failed = False
+        self._by_date = {}
         self.selected_date = date_str_from_date(datetime.date.today())
         self.selected_subject = None
 
+        # Debounced save state (see _schedule_flush)
+        self._dirty = False
+        self._flush_job = None
+        self._last_flush = 0.0
+        self._last_payload_hash = None  # digest of the bytes last written to info.json
+        self._last_backup_mtime = None  # info.json mtime at the last backup
+        self._batch = None  # image add in progress (see _begin_batch)
+        self._pending_paths = []  # dropped files waiting for the drop quiet period
+        self._drop_job = None
+        self._poll_job = None  # pending _poll_copies timer
+        self._queued_adds = deque()  # (paths, date, subject) that arrived while a batch was copying
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=COPY_WORKERS)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # Main frame
         self.main = ttk.Frame(root, padding=12)
         self.main.pack(fill=tk.BOTH, expand=True)
 
         self.setup_styles()
         self.build_ui()
-        self.load_data()
-        self.load_day()
+        # Read info.json and fill the lists after the first frame is drawn
+        self.root.after_idle(self.load_data)
 
 
     def setup_styles(self):
@@ -282,10 +423,9 @@ class InfoManagerApp:
         # Drag-and-drop area
         dnd_frame = ttk.Frame(right, height=80, relief=tk.SUNKEN)
         dnd_frame.pack(fill=tk.X, pady=(12, 0))
-        dnd_label = ttk.Label(dnd_frame, text="Drag & drop images here (or use the Add images button)")
+        dnd_label = ttk.Label(dnd_frame, text="Drag & drop images onto this window (or use the Add images button)")
         dnd_label.pack(expand=True, pady=18)
 
-        self.dnd_frame = dnd_frame  # keep ref for DnD binding
         if TRY_TKDNDF:
             try:
                 self.register_dnd()
@@ -307,10 +447,11 @@ class InfoManagerApp:
             files = self.root.tk.splitlist(event.data)
             self.handle_dropped_files(files)
 
-        # The drop target needs to be registered on a widget that supports it.
+        # Register once on the TkinterDnD root: drops over any child widget are
+        # delivered to it as a single <<Drop>> event.
         try:
-            self.dnd_frame.drop_target_register(DND_FILES)
-            self.dnd_frame.dnd_bind('<<Drop>>', lambda e: drop_event(e))
+            self.root.drop_target_register(DND_FILES)
+            self.root.dnd_bind('<<Drop>>', drop_event)
         except Exception:
             # sometimes the dnd registration fails depending on platform / setup
             pass
@@ -319,7 +460,21 @@ class InfoManagerApp:
     # Data loading + UI sync
     # --------------------
     def load_data(self):
-        self.data = read_json()
+        try:
+            data = read_json()
+        except Exception as e:
+            # Nothing can work without the data, and saving would clobber the file: stop here
+            self._load_failed = True
+            self._pending_paths = []
+            messagebox.showerror(
+                "Load Failed",
+                f"Could not read {INFO_JSON}:\n{e}\n\nFix or restore it (backups are in {BACKUP_DIR}/) and restart."
+            )
+            self._io_pool.shutdown(wait=False)
+            self.root.destroy()
+            return
+        self.data = data
+        self._by_date = build_index(self.data)
         self.load_day()  # populate subjects for current date
 
     def set_today(self):
@@ -327,6 +482,8 @@ class InfoManagerApp:
         self.load_day()
 
     def load_day(self):
+        if self.data is None:  # still loading (see load_data)
+            return
         s = self.date_var.get().strip()
         if not s:
             messagebox.showerror("Invalid Date", "Date cannot be empty. Use DD-MM-YYYY.")
@@ -338,16 +495,16 @@ class InfoManagerApp:
         date_str = date_str_from_date(d)
         self.selected_date = date_str
         # Ensure day exists in data
-        day_entry = get_day_entry(self.data, date_str)
+        day_entry = get_day_entry(self._by_date, date_str)
         if not day_entry:
-            # create a new day entry (not saved to disk until Save JSON)
-            day_entry = create_day_entry(self.data, date_str)
+            # create a new day entry (written with the next save)
+            day_entry = create_day_entry(self.data, self._by_date, date_str)
         self.populate_subjects_from_day(day_entry)
 
     def populate_subjects_from_day(self, day_entry):
         self.subject_listbox.delete(0, tk.END)
-        for subj in day_entry.get("subjects", []):
-            self.subject_listbox.insert(tk.END, subj.get("subject"))
+        for name in day_entry["subjects"]:
+            self.subject_listbox.insert(tk.END, name)
         self.images_listbox.delete(0, tk.END)
         self.selected_subject = None
 
@@ -361,36 +518,36 @@ class InfoManagerApp:
         self.populate_images_for_subject(subj_name)
 
     def populate_images_for_subject(self, subject):
+        # Only the selected day's images: these are the ones add/remove operate on
         self.images_listbox.delete(0, tk.END)
-        all_images = []
-        for day in self.data:
-            for subj in day["subjects"]:
-                if subj["subject"] == subject:
-                    all_images.extend(subj["images"])
-        for img_path in all_images:
-            self.images_listbox.insert(tk.END, img_path)
+        day_entry = get_day_entry(self._by_date, self.selected_date)
+        images = get_subject_images(day_entry, subject) if day_entry else None
+        if images:
+            self.images_listbox.insert(tk.END, *images)
 
 
     # ------------- fixed add_subject -------------
     def add_subject(self):
+        if self.data is None:  # still loading (see load_data)
+            return
         name = self.new_subject_var.get().strip()
         if not name:
             messagebox.showerror("Empty Subject", "Please type a subject name.")
             return
 
-        day_entry = get_day_entry(self.data, self.selected_date)
+        day_entry = get_day_entry(self._by_date, self.selected_date)
         if not day_entry:
-            day_entry = create_day_entry(self.data, self.selected_date)
+            day_entry = create_day_entry(self.data, self._by_date, self.selected_date)
 
-        subj_entry = get_subject_entry(day_entry, name)
-        if subj_entry:
+        if name in day_entry["subjects"]:
             messagebox.showinfo("Exists", f"Subject '{name}' already exists for {self.selected_date}.")
             return
 
         # Create new subject and add to UI, then select it
-        create_subject_entry(day_entry, name)
+        subject_images(day_entry, name)
         self.subject_listbox.insert(tk.END, name)
         self.new_subject_var.set("")
+        self._schedule_flush()
 
         # select newly added subject
         last = self.subject_listbox.size() - 1
@@ -403,37 +560,133 @@ class InfoManagerApp:
 
     # ------------- unified add_images -------------
     def add_images(self, paths):
+        if self.data is None:  # still loading (see load_data)
+            return
         if not self.selected_subject:
             messagebox.showerror("No Subject Selected", "Please select a subject first (or add one).")
             return
 
-        copied = copy_images_to_folder(paths, self.selected_date, self.selected_subject)
-        if not copied:
-            messagebox.showerror("Copy Failed", "No images were copied.")
-            return
+        self._start_batch(paths, self.selected_date, self.selected_subject)
 
-        # Only append to existing subject's 'images' field
-        day_entry = get_day_entry(self.data, self.selected_date)
-        if not day_entry:
-            day_entry = create_day_entry(self.data, self.selected_date)
+    def _start_batch(self, paths, date_str, subject):
+        if self._batch is not None:
+            # Still copying the previous batch; its file names aren't on disk yet,
+            # so run this one once it has finished (see _end_batch).
+            # The target is kept, the selection may change in the meantime.
+            self._queued_adds.append((paths, date_str, subject))
+            return
 
-        subj_entry = get_subject_entry(day_entry, self.selected_subject)
-        if not subj_entry:
-            subj_entry = create_subject_entry(day_entry, self.selected_subject)
+        # Names are chosen here on the UI thread, the copies run on the pool.
+        # Plan before opening the batch so a failure here can't leave it stuck open.
+        try:
+            copies = plan_image_copies(paths, date_str, subject)
+        except Exception as e:
+            messagebox.showerror("Copy Failed", f"Could not prepare images/{date_str}:\n{e}")
+            return
+        self._begin_batch(date_str, subject)
+        for src, dst in copies:
+            self._batch["copies"].append((self._io_pool.submit(fast_copy, src, dst), dst))
+        self._poll_copies()
+
+    def _poll_copies(self, wait=False):
+        # Stage finished copies in submission order so images keep their numbering order
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        batch = self._batch
+        if batch is None:
+            return
+        copies = batch["copies"]
+        try:
+            while copies and (wait or copies[0][0].done()):
+                future, dst = copies.popleft()
+                if future.exception() is None:
+                    self._stage_image(dst.as_posix())
+                else:
+                    batch["errors"].append(f"{dst.name}: {future.exception()}")
+                    try:
+                        dst.unlink(missing_ok=True)  # don't leave a half-copied file behind
+                    except OSError:
+                        pass
+        except Exception as e:
+            # Never leave the batch open: later adds would queue behind it forever
+            batch["errors"].append(f"{e} ({len(copies)} image(s) not recorded)")
+            copies.clear()
+        if copies:
+            self._poll_job = self.root.after(COPY_POLL_MS, self._poll_copies)
+            return
+        try:
+            if batch["copied"]:
+                fsync_dir(IMAGES_ROOT / batch["date"])
+        finally:
+            self._end_batch()
+
+    # Batched image adds: stage every copied file in memory, then save and refresh once.
+    def _begin_batch(self, date_str, subject):
+        self._batch = {
+            "date": date_str,
+            "subject": subject,
+            "copies": deque(),  # (future, dst) still being copied
+            "errors": [],
+            "images": None,  # the subject's image list in self.data
+            "existing": None,  # set of the subject's image paths, built once per batch
+            "created_subject": False,
+            "copied": 0,
+            "new_images": [],
+        }
+
+    def _stage_image(self, rel):
+        batch = self._batch
+        batch["copied"] += 1
+        images = batch["images"]
+        if images is None:
+            # Only append to existing subject's 'images' field
+            day_entry = get_day_entry(self._by_date, batch["date"])
+            if not day_entry:
+                day_entry = create_day_entry(self.data, self._by_date, batch["date"])
+            batch["created_subject"] = batch["subject"] not in day_entry["subjects"]
+            images = batch["images"] = subject_images(day_entry, batch["subject"])
+            batch["existing"] = set(images)
+            if batch["created_subject"] and batch["date"] == self.selected_date:
+                self.subject_listbox.insert(tk.END, batch["subject"])
 
         # Append only new relative paths, avoid duplicates
-        added = 0
-        for p in copied:
-            rel = os.path.normpath(p).replace(os.path.sep, '/')
-            if rel not in subj_entry.get("images", []):
-                subj_entry.setdefault("images", []).append(rel)
-                added += 1
+        # (rel comes from Path.as_posix(), already in the '/'-separated form info.json uses)
+        if rel not in batch["existing"]:
+            batch["existing"].add(rel)
+            images.append(rel)
+            batch["new_images"].append(rel)
+            # Add the row as the data changes, so a listbox rebuilt from self.data
+            # mid-batch (subject re-clicked, image removed) never gets it twice.
+            # The user may have moved to another day/subject while copying.
+            if batch["date"] == self.selected_date and batch["subject"] == self.selected_subject:
+                self.images_listbox.insert(tk.END, rel)
+
+    def _end_batch(self):
+        batch, self._batch = self._batch, None
+        # Adds that arrived while this batch was copying
+        if self._queued_adds:
+            self.root.after_idle(self._start_queued_batch)
+
+        errors = "\n".join(batch["errors"][:5])
+        if not batch["copied"]:
+            messagebox.showerror("Copy Failed", "No images were copied." + (f"\n\n{errors}" if errors else ""))
+            return
 
-        self.populate_images_for_subject(self.selected_subject)
+        # The listboxes were already updated row by row in _stage_image
+        new_images = batch["new_images"]
+        if new_images:
+            self._schedule_flush()
         messagebox.showinfo(
             "Images Added",
-            f"Added {added} new image(s) to '{self.selected_subject}' ({self.selected_date})."
+            f"Added {len(new_images)} new image(s) to '{batch['subject']}' ({batch['date']})."
         )
+        if errors:
+            messagebox.showwarning("Copy Failed", f"Some images could not be copied:\n\n{errors}")
+
+    def _start_queued_batch(self):
+        if self._queued_adds and self._batch is None:
+            self._start_batch(*self._queued_adds.popleft())
 
     # --------------------
     # Image add / remove / DnD helpers
@@ -444,7 +697,26 @@ class InfoManagerApp:
         if not image_files:
             messagebox.showwarning("No images", "No supported image files were dropped.")
             return
-        self.add_images(image_files)
+        # A drop can arrive as several events; collect them and add once things go quiet
+        self._pending_paths.extend(image_files)
+        if self._drop_job is not None:
+            self.root.after_cancel(self._drop_job)
+        self._drop_job = self.root.after(DROP_QUIET_MS, self._process_pending_drops)
+
+    def _process_pending_drops(self):
+        self._drop_job = None
+        if self._load_failed:
+            self._pending_paths = []
+            return
+        if self.data is None:
+            # info.json not loaded yet (see load_data); keep the drops and retry
+            self._drop_job = self.root.after(DROP_QUIET_MS, self._process_pending_drops)
+            return
+        paths, self._pending_paths = self._pending_paths, []
+        if not paths:
+            return
+        # the same file delivered by more than one event is only added once
+        self.add_images(list(dict.fromkeys(paths)))
 
     def add_images_via_dialog(self):
         paths = filedialog.askopenfilenames(title="Select image files", filetypes=[
@@ -455,6 +727,8 @@ class InfoManagerApp:
         self.add_images(paths)
 
     def remove_selected_image(self):
+        if self.data is None:  # still loading (see load_data)
+            return
         sel = self.images_listbox.curselection()
         if not sel:
             return
@@ -463,10 +737,11 @@ class InfoManagerApp:
         # confirm removal from JSON (not deleting file)
         if not messagebox.askyesno("Remove", f"Remove image reference:\n{img_path}\n\nThis will not delete the image file."):
             return
-        day_entry = get_day_entry(self.data, self.selected_date)
-        subj_entry = get_subject_entry(day_entry, self.selected_subject) if day_entry else None
-        if subj_entry and img_path in subj_entry.get("images", []):
-            subj_entry["images"].remove(img_path)
+        day_entry = get_day_entry(self._by_date, self.selected_date)
+        images = get_subject_images(day_entry, self.selected_subject) if day_entry else None
+        if images and img_path in images:
+            images.remove(img_path)
+            self._schedule_flush()
         self.populate_images_for_subject(self.selected_subject)
 
     # --------------------
@@ -477,20 +752,97 @@ class InfoManagerApp:
             messagebox.showinfo("No info.json", "No info.json file found to back up.")
             return
         dest = backup_json()
+        self._last_backup_mtime = INFO_JSON.stat().st_mtime_ns
         messagebox.showinfo("Backup Created", f"Backup saved to:\n{dest}")
 
     def save_json_with_backup(self):
-        # backup
-        if INFO_JSON.exists():
-            backup_json()
-        # write JSON
+        if self.data is None:  # still loading (see load_data)
+            return
+        result = self._flush(force=True)
+        if result is None:
+            return
+        wrote, backed_up = result
+        if not wrote:
+            messagebox.showinfo("Saved", "No changes since the last save.")
+        elif backed_up:
+            messagebox.showinfo("Saved", "info.json updated (backup created).")
+        else:
+            messagebox.showinfo("Saved", "info.json updated.")
+
+    def _schedule_flush(self):
+        """
+        Mark data as changed and save it.
+        The first edit of a burst is backed up and written immediately; further
+        edits within FLUSH_DELAY_MS are coalesced into one more write. That
+        trailing write skips the backup, so the burst's only backup is the
+        file as it was before the burst.
+        """
+        self._dirty = True
+        if self._flush_job is None and time.monotonic() - self._last_flush >= FLUSH_DELAY_MS / 1000:
+            self._flush()
+            return
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+        self._flush_job = self.root.after(FLUSH_DELAY_MS, lambda: self._flush(backup=False))
+
+    def _flush(self, force=False, backup=True):
+        # Returns (wrote, backed_up) on success, None if saving failed
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+            self._flush_job = None
+        if self.data is None or not (self._dirty or force):
+            return (False, False)
+        wrote = backed_up = False
         try:
-            write_json(self.data)
-            messagebox.showinfo("Saved", f"info.json updated (backup created).")
+            payload = dump_json(self.data)
+            digest = payload_digest(payload)
+            # Identical to what we last wrote -> skip both the backup and the write
+            if digest != self._last_payload_hash or not INFO_JSON.exists():
+                if backup:
+                    backed_up = self._backup_if_changed()
+                write_json_bytes(payload)
+                self._last_payload_hash = digest
+                wrote = True
         except Exception as e:
             messagebox.showerror("Save Failed", f"Failed to save info.json:\n{e}")
-            
-    
+            return None
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        return (wrote, backed_up)
+
+    def _backup_if_changed(self):
+        # Skip the copy when info.json hasn't changed since the last backup.
+        # Returns whether a backup was written.
+        if not INFO_JSON.exists():
+            return False
+        mtime = INFO_JSON.stat().st_mtime_ns
+        if mtime == self._last_backup_mtime:
+            return False
+        backup_json()
+        self._last_backup_mtime = mtime
+        return True
+
+    def _on_close(self):
+        # Finish copies in flight, and every add queued behind them, so their
+        # images make it into info.json before the window goes away
+        if self._drop_job is not None:
+            self.root.after_cancel(self._drop_job)
+            self._drop_job = None
+        if self._pending_paths and self.data is not None:
+            self._process_pending_drops()
+        while self._batch is not None or self._queued_adds:
+            if self._batch is None:
+                self._start_batch(*self._queued_adds.popleft())
+            if self._batch is not None:
+                self._poll_copies(wait=True)
+        # Write out any edits still waiting on the debounce timer; like the
+        # timer's own flush, that belongs to a burst already backed up
+        trailing = self._flush_job is not None
+        if self._dirty and not self._flush(backup=not trailing):
+            if not messagebox.askyesno("Quit", "info.json could not be saved. Quit anyway?"):
+                return
+        self._io_pool.shutdown(wait=True)
+        self.root.destroy()
 
 
 def main():